@@ -1,15 +1,28 @@
 # quiz_app.py
 
 import streamlit as st
-from sqlalchemy import create_engine, Column, Integer, String, Text, CheckConstraint
+from sqlalchemy import func, select, Column, Integer, String, Text, CheckConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
+from streamlit.connections import SQLConnection
 from dotenv import load_dotenv
 import os
 import json
+import csv
+import io
 import logging
+import logging.handlers
+import queue
+import atexit
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+import pyarrow as pa
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # ---------------------------
 # Configuration and Setup
@@ -22,18 +35,30 @@ load_dotenv()
 DEBUG_MODE = os.getenv('DEBUG', 'False').lower() in ['true', '1', 't']
 
 # Configure Logging
-if DEBUG_MODE:
-    logging.basicConfig(
-        filename='quiz_app.log',
-        level=logging.DEBUG,  # More verbose logging
-        format='%(asctime)s:%(levelname)s:%(message)s'
-    )
-else:
-    logging.basicConfig(
-        filename='quiz_app.log',
-        level=logging.INFO,
-        format='%(asctime)s:%(levelname)s:%(message)s'
-    )
+def start_log_listener():
+    """
+    Routes log records through a queue to a background file writer.
+
+    Reruns neither block on file I/O nor attach duplicate handlers: setup is
+    skipped when the root logger already has a QueueHandler, which survives
+    both reruns and Streamlit's "Clear cache".
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in root_logger.handlers):
+        return
+
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('quiz_app.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+
+    root_logger.setLevel(logging.DEBUG if DEBUG_MODE else logging.INFO)  # More verbose logging in debug mode
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener.start()
+    atexit.register(listener.stop)
+
+start_log_listener()
 
 logger = logging.getLogger(__name__)
 
@@ -44,17 +69,33 @@ DB_NAME = os.getenv('DB_NAME', 'quiz_app')
 DB_USER = os.getenv('DB_USER', 'quiz_user')
 DB_PASSWORD = os.getenv('DB_PASSWORD', 'your_secure_password')
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# Create SQLAlchemy engine and session
-try:
-    engine = create_engine(DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    logger.info("Database engine created successfully.")
-except Exception as e:
-    logger.error(f"Error creating engine: {e}")
-    st.error(f"Failed to create database engine: {e}")
-    st.stop()
+# ---------------------------
+# Database Engine and Sessions
+# ---------------------------
+
+def get_connection() -> SQLConnection:
+    """
+    Returns the app's Streamlit SQL connection.
+
+    st.connection caches the connection per server process; its engine keeps
+    a warm pool across reruns, and pool_pre_ping transparently replaces
+    connections dropped by the server instead of failing the rerun.
+
+    Returns:
+        SQLConnection: The shared connection to the questions database.
+    """
+    return st.connection(
+        "questions_db",
+        type="sql",
+        url=DATABASE_URL,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
 
 # Define Base for declarative models
 Base = declarative_base()
@@ -91,59 +132,132 @@ class Question(Base):
         CheckConstraint("correct_option IN ('A', 'B', 'C', 'D')", name='correct_option_check'),
     )
 
-# Create tables if they do not exist
-try:
-    Base.metadata.create_all(bind=engine)
+# Columns needed to display and score a question; explanations are loaded on demand
+QUIZ_COLUMNS = (
+    Question.id,
+    Question.question_text,
+    Question.option_a,
+    Question.option_b,
+    Question.option_c,
+    Question.option_d,
+    Question.correct_option
+)
+
+# Columns written when adding questions, in COPY column order
+INSERT_COLUMNS = ('question_text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_option', 'explanation')
+
+# Fields every uploaded question must provide
+REQUIRED_FIELDS = frozenset(INSERT_COLUMNS)
+
+# Uploads larger than this are loaded with PostgreSQL COPY instead of INSERTs
+COPY_THRESHOLD = 500
+
+# NULL marker for COPY; fields are always quoted, so FORCE_NULL is needed to match it
+COPY_NULL = r'\N'
+
+# Position of each option letter in (option_a, option_b, option_c, option_d)
+OPTION_INDEX = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+@st.cache_resource
+def init_schema() -> bool:
+    """
+    Creates the database tables if they do not exist, once per server process.
+
+    Returns:
+        bool: True once the schema has been checked/created.
+    """
+    Base.metadata.create_all(bind=get_connection().engine)
     logger.info("Database tables checked/created.")
-except Exception as e:
-    logger.error(f"Error creating tables: {e}")
-    st.error(f"Failed to create database tables: {e}")
-    st.stop()
+    return True
 
 # ---------------------------
 # Utility Functions
 # ---------------------------
 
-def get_db_session() -> Session:
+def fetch_explanations(session: Session, ids: list) -> dict:
     """
-    Creates and returns a new SQLAlchemy session.
+    Retrieves the explanations for the given questions.
+
+    Args:
+        session (Session): SQLAlchemy session.
+        ids (list): IDs of the questions to fetch explanations for.
 
     Returns:
-        Session: A SQLAlchemy session object.
+        dict: Mapping of question ID to explanation text.
     """
     try:
-        session = SessionLocal()
-        logger.debug("Database session created.")
-        return session
+        rows = session.query(Question.id, Question.explanation).filter(Question.id.in_(ids)).all()
+        return {row.id: row.explanation for row in rows}
     except Exception as e:
-        logger.error(f"Error creating database session: {e}")
+        logger.error(f"Error fetching explanations: {e}")
         if DEBUG_MODE:
-            st.error(f"Database connection failed: {e}")
+            st.error(f"Failed to retrieve explanations: {e}")
         else:
-            st.error("Database connection failed. Please contact the administrator.")
-        st.stop()
+            st.error("Failed to retrieve explanations.")
+        return {}
 
-def fetch_all_questions(session: Session) -> list:
+def fetch_question_bank_version(session: Session) -> tuple:
     """
-    Retrieves all quiz questions from the database.
+    Retrieves a cheap fingerprint of the question bank.
 
     Args:
         session (Session): SQLAlchemy session.
 
     Returns:
-        list: List of Question objects.
+        tuple: (max ID, row count) of the questions table, or None on failure.
     """
     try:
-        questions = session.query(Question).all()
-        logger.info(f"Fetched {len(questions)} questions from the database.")
-        return questions
+        max_id, count = session.query(func.max(Question.id), func.count(Question.id)).one()
+        return (max_id, count)
     except Exception as e:
-        logger.error(f"Error fetching questions: {e}")
+        logger.error(f"Error checking question bank version: {e}")
         if DEBUG_MODE:
             st.error(f"Failed to retrieve questions: {e}")
         else:
             st.error("Failed to retrieve questions.")
-        return []
+        return None
+
+@st.cache_resource(max_entries=1)
+def load_question_table(version: tuple) -> pa.Table:
+    """
+    Loads all quiz questions into an Arrow table shared by every session.
+
+    The cache is keyed on the bank's version, so it is only rebuilt when
+    questions are added or removed.
+
+    Args:
+        version (tuple): Question bank fingerprint from `fetch_question_bank_version`.
+
+    Returns:
+        pa.Table: One row per question with the `QUIZ_COLUMNS` columns plus the
+        correct option's position as `correct_idx`, ordered by ID.
+    """
+    statement = select(*QUIZ_COLUMNS).order_by(Question.id)
+    df = pd.read_sql(statement, get_connection().engine)
+    df['correct_idx'] = df['correct_option'].map(OPTION_INDEX).astype(np.int8)
+    logger.info(f"Loaded {len(df)} questions into the question cache.")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def get_question_table(session: Session) -> pa.Table:
+    """
+    Returns the cached question table, rebuilding it if the bank has changed.
+
+    Args:
+        session (Session): SQLAlchemy session.
+
+    Returns:
+        pa.Table: The current question table, or None if it could not be loaded.
+    """
+    version = fetch_question_bank_version(session)
+    if version is None:
+        return None
+    return load_question_table(version)
+
+def clear_question_cache():
+    """
+    Drops the cached question table after questions are added.
+    """
+    load_question_table.clear()
 
 def add_question(session: Session, question_data: dict) -> bool:
     """
@@ -171,18 +285,80 @@ def add_question(session: Session, question_data: dict) -> bool:
             st.error("Failed to add question. Please check the logs for details.")
         return False
 
-def parse_json_questions(json_data: str) -> list:
+def add_questions_bulk(session: Session, questions: list) -> int:
+    """
+    Adds several questions to the database in a single transaction.
+
+    Uploads above `COPY_THRESHOLD` questions are streamed with COPY FROM STDIN
+    when the connection uses psycopg2; everything else uses a batched INSERT.
+
+    Args:
+        session (Session): SQLAlchemy session.
+        questions (list): List of validated question dictionaries.
+
+    Returns:
+        int: Number of questions added, 0 if the insert failed.
+    """
+    try:
+        if len(questions) > COPY_THRESHOLD and session.connection().dialect.driver == 'psycopg2':
+            copy_questions(session, questions)
+        else:
+            session.bulk_insert_mappings(Question, questions)
+        session.commit()
+        logger.info(f"Bulk added {len(questions)} questions.")
+        return len(questions)
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error bulk adding questions: {e}")
+        if DEBUG_MODE:
+            st.error(f"Failed to add questions: {e}")
+        else:
+            st.error("Failed to add questions. Please check the logs for details.")
+        return 0
+
+def copy_questions(session: Session, questions: list):
+    """
+    Streams questions into the database with PostgreSQL's COPY protocol.
+
+    Runs inside the session's current transaction; the caller commits.
+    Every field is quoted so empty strings are stored as '' rather than NULL,
+    matching `bulk_insert_mappings`; missing values are sent as NULL.
+
+    Args:
+        session (Session): SQLAlchemy session.
+        questions (list): List of validated question dictionaries.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    for q in questions:
+        writer.writerow([COPY_NULL if q.get(column) is None else q[column] for column in INSERT_COLUMNS])
+    buffer.seek(0)
+
+    columns = ', '.join(INSERT_COLUMNS)
+    raw_connection = session.connection().connection
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {Question.__tablename__} ({columns}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{COPY_NULL}', FORCE_NULL ({columns}))",
+            buffer
+        )
+
+@st.cache_data
+def parse_json_questions(json_bytes: bytes) -> list:
     """
     Parses JSON data to extract questions.
 
+    Results are cached on the raw upload bytes, so reruns triggered by other
+    widgets do not parse the same file again.
+
     Args:
-        json_data (str): JSON string containing a list of questions.
+        json_bytes (bytes): Raw UTF-8 JSON content containing a list of questions.
 
     Returns:
         list: List of question dictionaries.
     """
     try:
-        questions = json.loads(json_data)
+        questions = orjson.loads(json_bytes) if orjson else json.loads(json_bytes)
         if isinstance(questions, list):
             logger.info(f"Parsed {len(questions)} questions from JSON data.")
             return questions
@@ -212,6 +388,14 @@ def main():
     st.set_page_config(page_title="Quiz Application", layout="wide")
     st.title("📚 Interactive Quiz Application")
 
+    # Create tables if they do not exist
+    try:
+        init_schema()
+    except Exception as e:
+        logger.error(f"Error creating tables: {e}")
+        st.error(f"Failed to create database tables: {e}")
+        st.stop()
+
     # Display Database Configuration in Debug Mode
     if DEBUG_MODE:
         st.sidebar.header("Debug Information")
@@ -231,127 +415,190 @@ def main():
     elif choice == "Admin: Add Questions":
         admin_add_questions()
 
-def take_quiz():
+def get_remaining_time() -> int:
     """
-    Renders the quiz-taking interface for users.
+    Computes the time left before the quiz is submitted automatically.
+
+    Returns:
+        int: Remaining whole seconds; zero or negative once the limit is reached.
     """
-    session = get_db_session()
-    questions = fetch_all_questions(session)
-    if not questions:
-        st.warning("No questions available. Please contact the administrator.")
-        return
+    elapsed_seconds = int(time.monotonic() - st.session_state.start_time)
+    return st.session_state.time_limit * 60 - elapsed_seconds
 
-    # Initialize session state
-    if 'current_question' not in st.session_state:
-        st.session_state.current_question = 0
-    if 'answers' not in st.session_state:
-        st.session_state.answers = {}
-    if 'start_time' not in st.session_state:
-        st.session_state.start_time = datetime.now()
-    if 'time_limit' not in st.session_state:
-        st.session_state.time_limit = 15  # minutes
-
-    # Timer Logic
-    elapsed_time = datetime.now() - st.session_state.start_time
-    remaining_time = timedelta(minutes=st.session_state.time_limit) - elapsed_time
-
-    if remaining_time <= timedelta(0):
-        st.session_state.current_question = len(questions)  # End quiz
-        st.success("Time's up! Submitting your answers...")
-        submit_quiz(session, questions)
-        return
+@st.fragment(run_every=1)
+def show_timer():
+    """
+    Renders the countdown, refreshing it every second without rerunning the quiz.
 
-    st.sidebar.write(f"⏰ Time Remaining: {str(remaining_time).split('.')[0]}")
-
-    # Display current question
-    if st.session_state.current_question < len(questions):
-        question = questions[st.session_state.current_question]
-        st.header(f"Question {st.session_state.current_question + 1} of {len(questions)}")
-        st.write(question.question_text)
-
-        # Display options
-        options = {
-            'A': question.option_a,
-            'B': question.option_b,
-            'C': question.option_c,
-            'D': question.option_d
-        }
-        default_index = list(options.keys()).index(st.session_state.answers.get(question.id, 'A')) if question.id in st.session_state.answers else -1
-        selected = st.radio("Select an option:", list(options.keys()), index=default_index if default_index >=0 else 0)
-
-        # Save answer
-        st.session_state.answers[question.id] = selected
-
-        # Navigation Buttons
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("Previous") and st.session_state.current_question > 0:
-                st.session_state.current_question -= 1
-        with col2:
-            if st.button("Save for Later"):
+    Triggers a full rerun once time is up so the quiz gets submitted.
+    """
+    remaining = get_remaining_time()
+    if remaining <= 0:
+        st.rerun()
+    st.write(f"⏰ Time Remaining: {remaining // 60:02d}:{remaining % 60:02d}")
+
+def take_quiz():
+    """
+    Renders the quiz-taking interface for users.
+    """
+    with get_connection().session as session:
+        questions = get_question_table(session)
+        if questions is None:
+            return
+        if not questions.num_rows:
+            st.warning("No questions available. Please contact the administrator.")
+            return
+
+        # Initialize session state
+        if 'total_questions' not in st.session_state:
+            st.session_state.total_questions = questions.num_rows
+        if 'current_question' not in st.session_state:
+            st.session_state.current_question = 0
+        if 'answers' not in st.session_state:
+            # ord() of the chosen letter per question position, 0 if unanswered
+            st.session_state.answers = bytearray(st.session_state.total_questions)
+        if 'start_time' not in st.session_state:
+            st.session_state.start_time = time.monotonic()
+        if 'time_limit' not in st.session_state:
+            st.session_state.time_limit = 15  # minutes
+
+        # Fixed at quiz start; clamped in case questions were removed since
+        total_questions = min(st.session_state.total_questions, questions.num_rows)
+
+        # The timer only runs while there are questions left to answer
+        if st.session_state.current_question < total_questions:
+            if get_remaining_time() <= 0:
+                st.session_state.current_question = total_questions  # End quiz
+                st.success("Time's up! Submitting your answers...")
+                submit_quiz(session, questions)
+                return
+
+            with st.sidebar:
+                show_timer()
+
+        # Display current question
+        idx = st.session_state.current_question
+        if idx < total_questions:
+            question = {name: questions.column(name)[idx].as_py() for name in questions.column_names}
+
+            # Answer selection only reruns the script when a form button is pressed
+            with st.form(f"q{idx}", clear_on_submit=False):
+                st.header(f"Question {idx + 1} of {total_questions}")
+                st.write(question['question_text'])
+
+                # Display options
+                options = {
+                    'A': question['option_a'],
+                    'B': question['option_b'],
+                    'C': question['option_c'],
+                    'D': question['option_d']
+                }
+                saved = st.session_state.answers[idx]
+                default_index = saved - ord('A') if saved else 0
+                selected = st.radio("Select an option:", list(options.keys()), index=default_index)
+
+                # Navigation Buttons
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    previous = st.form_submit_button("Previous")
+                with col2:
+                    save = st.form_submit_button("Save for Later")
+                with col3:
+                    advance = st.form_submit_button("Next" if idx < total_questions - 1 else "Submit")
+
+            if previous or save or advance:
+                # Save answer
+                st.session_state.answers[idx] = ord(selected)
+
+            if save:
                 st.success("Your progress has been saved.")
                 logger.info("User saved progress.")
-        with col3:
-            if st.button("Next") and st.session_state.current_question < len(questions) - 1:
+            elif previous and idx > 0:
+                st.session_state.current_question -= 1
+                st.rerun()
+            elif advance:
+                # Moving past the last question ends the quiz
                 st.session_state.current_question += 1
-            elif st.button("Submit") and st.session_state.current_question == len(questions) - 1:
-                submit_quiz(session, questions)
+                st.rerun()
 
-    else:
-        st.success("You have completed the quiz!")
-        submit_quiz(session, questions)
+        else:
+            st.success("You have completed the quiz!")
+            submit_quiz(session, questions)
 
-    # Review Answers
-    if st.checkbox("Review Answers"):
-        review_answers(session, questions)
+        # Review Answers
+        if st.checkbox("Review Answers"):
+            review_answers(session, questions)
 
-def submit_quiz(session: Session, questions: list):
+def submit_quiz(session: Session, questions: pa.Table):
     """
     Submits the quiz, calculates the score, and displays explanations.
 
+    Scoring is done column-wise over the cached question table and the
+    answer buffer, without building per-question Python objects.
+
     Args:
         session (Session): SQLAlchemy session.
-        questions (list): List of Question objects.
-    """
-    score = 0
-    results = []
-
-    for question in questions:
-        user_answer = st.session_state.answers.get(question.id, "No Answer")
-        correct = user_answer == question.correct_option
-        if correct:
-            score += 1
-        results.append({
-            'Question': question.question_text,
-            'Your Answer': f"{user_answer}: {getattr(question, f'option_{user_answer.lower()}')}" if user_answer != "No Answer" else "No Answer",
-            'Correct Answer': f"{question.correct_option}: {getattr(question, f'option_{question.correct_option.lower()}')}",
-            'Explanation': question.explanation,
-            'Result': "Correct" if correct else "Incorrect"
-        })
+        questions (pa.Table): Cached question table.
+    """
+    codes = np.frombuffer(st.session_state.answers, dtype=np.uint8)
+    questions = questions.slice(0, len(codes))
+    codes = codes[:questions.num_rows]
+    ids = questions.column('id').to_pylist()
+    explanations = fetch_explanations(session, ids)
+
+    answered = codes != 0
+    user_idx = np.where(answered, codes.astype(np.int8) - ord('A'), 0)
+    correct_idx = questions.column('correct_idx').to_numpy()
+    correct = answered & (user_idx == correct_idx)
+    score = int(correct.sum())
+
+    # Pick each row's option text by letter position
+    rows = np.arange(questions.num_rows)
+    letters = np.array(list(OPTION_INDEX), dtype=object)
+    opts = np.column_stack([
+        questions.column(name).to_numpy()
+        for name in ('option_a', 'option_b', 'option_c', 'option_d')
+    ])
+    user_text = opts[rows, user_idx]
+    correct_text = opts[rows, correct_idx]
+
+    # Streamlit renders Arrow tables directly, so no results DataFrame is built
+    results = pa.table({
+        'Question': questions.column('question_text'),
+        'Your Answer': np.where(answered, letters[user_idx] + ": " + user_text, "No Answer"),
+        'Correct Answer': letters[correct_idx] + ": " + correct_text,
+        'Explanation': [explanations.get(question_id) for question_id in ids],
+        'Result': np.where(correct, "Correct", "Incorrect")
+    })
 
     st.header("🎉 Quiz Results")
-    st.write(f"**Your Score:** {score} / {len(questions)}")
-    df_results = pd.DataFrame(results)
-    st.dataframe(df_results)
+    st.write(f"**Your Score:** {score} / {questions.num_rows}")
+    st.dataframe(results)
 
-    logger.info(f"User submitted quiz with score {score}/{len(questions)}.")
+    logger.info(f"User submitted quiz with score {score}/{questions.num_rows}.")
 
-def review_answers(session: Session, questions: list):
+def review_answers(session: Session, questions: pa.Table):
     """
-    Displays a detailed review of the user's answers.
+    Displays a detailed review of the questions the user has answered.
 
     Args:
         session (Session): SQLAlchemy session.
-        questions (list): List of Question objects.
+        questions (pa.Table): Cached question table.
     """
     st.header("🔍 Review Your Answers")
-    for idx, question in enumerate(questions, 1):
-        st.subheader(f"Question {idx}: {question.question_text}")
-        user_answer = st.session_state.answers.get(question.id, "No Answer")
-        correct = user_answer == question.correct_option
-        st.write(f"**Your Answer:** {user_answer}: {getattr(question, f'option_{user_answer.lower()}')}" if user_answer != "No Answer" else "**Your Answer:** No Answer")
-        st.write(f"**Correct Answer:** {question.correct_option}: {getattr(question, f'option_{question.correct_option.lower()}')}")
-        st.write(f"**Explanation:** {question.explanation}")
+    answers = st.session_state.answers
+    positions = np.flatnonzero(np.frombuffer(answers, dtype=np.uint8)[:questions.num_rows])
+    questions = questions.take(positions).to_pylist()
+    explanations = fetch_explanations(session, [question['id'] for question in questions])
+    for idx, question in zip(positions, questions):
+        st.subheader(f"Question {idx + 1}: {question['question_text']}")
+        user_answer = chr(answers[idx])
+        correct_option = question['correct_option']
+        correct = user_answer == correct_option
+        opts = (question['option_a'], question['option_b'], question['option_c'], question['option_d'])
+        st.write(f"**Your Answer:** {user_answer}: {opts[OPTION_INDEX[user_answer]]}")
+        st.write(f"**Correct Answer:** {correct_option}: {opts[question['correct_idx']]}")
+        st.write(f"**Explanation:** {explanations.get(question['id'])}")
         st.write(f"**Result:** {'✅ Correct' if correct else '❌ Incorrect'}")
         st.markdown("---")
 
@@ -361,75 +608,74 @@ def admin_add_questions():
     """
     st.header("🛠️ Admin Panel: Add New Questions")
 
-    session = get_db_session()
-
-    add_method = st.radio("Choose method to add questions:", ["Single Entry (Form)", "Bulk Entry (JSON)"])
+    with get_connection().session as session:
+        add_method = st.radio("Choose method to add questions:", ["Single Entry (Form)", "Bulk Entry (JSON)"])
 
-    if add_method == "Single Entry (Form)":
-        with st.form("add_question_form"):
-            st.subheader("Add a New Question")
+        if add_method == "Single Entry (Form)":
+            with st.form("add_question_form"):
+                st.subheader("Add a New Question")
 
-            question_text = st.text_area("Question Text", max_chars=500, help="Enter the question.")
+                question_text = st.text_area("Question Text", max_chars=500, help="Enter the question.")
 
-            option_a = st.text_input("Option A", max_chars=100)
-            option_b = st.text_input("Option B", max_chars=100)
-            option_c = st.text_input("Option C", max_chars=100)
-            option_d = st.text_input("Option D", max_chars=100)
+                option_a = st.text_input("Option A", max_chars=100)
+                option_b = st.text_input("Option B", max_chars=100)
+                option_c = st.text_input("Option C", max_chars=100)
+                option_d = st.text_input("Option D", max_chars=100)
 
-            correct_option = st.selectbox("Correct Option", ["A", "B", "C", "D"], help="Select the correct option.")
+                correct_option = st.selectbox("Correct Option", ["A", "B", "C", "D"], help="Select the correct option.")
 
-            explanation = st.text_area("Explanation", max_chars=500, help="Provide an explanation for the correct answer.")
+                explanation = st.text_area("Explanation", max_chars=500, help="Provide an explanation for the correct answer.")
 
-            submitted = st.form_submit_button("Add Question")
+                submitted = st.form_submit_button("Add Question")
 
-            if submitted:
-                question_data = {
-                    'question_text': question_text,
-                    'option_a': option_a,
-                    'option_b': option_b,
-                    'option_c': option_c,
-                    'option_d': option_d,
-                    'correct_option': correct_option,
-                    'explanation': explanation
-                }
+                if submitted:
+                    question_data = {
+                        'question_text': question_text,
+                        'option_a': option_a,
+                        'option_b': option_b,
+                        'option_c': option_c,
+                        'option_d': option_d,
+                        'correct_option': correct_option,
+                        'explanation': explanation
+                    }
 
-                if all([question_text, option_a, option_b, option_c, option_d, correct_option]):
-                    success = add_question(session, question_data)
-                    if success:
-                        st.success("Question added successfully!")
+                    if all([question_text, option_a, option_b, option_c, option_d, correct_option]):
+                        success = add_question(session, question_data)
+                        if success:
+                            clear_question_cache()
+                            st.success("Question added successfully!")
+                        else:
+                            st.error("Failed to add question. Check logs for details.")
                     else:
-                        st.error("Failed to add question. Check logs for details.")
-                else:
-                    st.error("Please fill in all fields.")
-
-    elif add_method == "Bulk Entry (JSON)":
-        uploaded_file = st.file_uploader("Upload JSON File", type=["json"], help="Upload a JSON file containing questions.")
-        if uploaded_file is not None:
-            try:
-                json_data = uploaded_file.read().decode('utf-8')
-                questions = parse_json_questions(json_data)
-                if questions:
-                    success_count = 0
-                    for q in questions:
+                        st.error("Please fill in all fields.")
+
+        elif add_method == "Bulk Entry (JSON)":
+            uploaded_file = st.file_uploader("Upload JSON File", type=["json"], help="Upload a JSON file containing questions.")
+            if uploaded_file is not None:
+                try:
+                    questions = parse_json_questions(uploaded_file.getvalue())
+                    if questions:
                         # Validate required fields
-                        required_fields = ['question_text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_option', 'explanation']
-                        if all(field in q for field in required_fields):
-                            success = add_question(session, q)
-                            if success:
-                                success_count += 1
-                        else:
-                            logger.warning(f"Question missing fields: {q}")
-                            if DEBUG_MODE:
-                                st.warning(f"Question missing fields: {q}")
+                        valid = []
+                        for q in questions:
+                            if REQUIRED_FIELDS <= q.keys():
+                                valid.append(q)
                             else:
-                                st.warning("A question was missing required fields and was skipped.")
-                    st.success(f"Successfully added {success_count} questions.")
-            except Exception as e:
-                logger.error(f"Error processing uploaded file: {e}")
-                if DEBUG_MODE:
-                    st.error(f"Failed to process the uploaded file: {e}")
-                else:
-                    st.error("Failed to process the uploaded file.")
+                                logger.warning(f"Question missing fields: {q}")
+                                if DEBUG_MODE:
+                                    st.warning(f"Question missing fields: {q}")
+                                else:
+                                    st.warning("A question was missing required fields and was skipped.")
+                        success_count = add_questions_bulk(session, valid) if valid else 0
+                        if success_count:
+                            clear_question_cache()
+                        st.success(f"Successfully added {success_count} questions.")
+                except Exception as e:
+                    logger.error(f"Error processing uploaded file: {e}")
+                    if DEBUG_MODE:
+                        st.error(f"Failed to process the uploaded file: {e}")
+                    else:
+                        st.error("Failed to process the uploaded file.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file